@@ -1,28 +1,50 @@
 import argparse
-import json
+import asyncio
+import hashlib
+import heapq
 import os
 import pathlib
 import re
+import xml.etree.ElementTree as ET
 from calendar import timegm
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 
-import feedparser
 import httpx
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from openai import OpenAI
 
+try:  # Optionaler C-Parser, deutlich schneller bei HTML-lastigen Zusammenfassungen.
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    HTMLParser = None
+
 DEFAULT_FEED_URL = "https://dasnetzundich.de/category/anleitung/feed/"
 DEFAULT_DAYS_OLD = 180
 DEFAULT_MAX_POSTS = 0
 DEFAULT_POSTED_LOG = "./posted_urls.json"
+DEFAULT_LLM_CACHE = "./llm_cache.json"
+DEFAULT_FEED_CACHE = "./feed_cache.json"
 DEFAULT_POSTED_LOG_KEEP = 0
 DEFAULT_VISIBILITY = "public"
 DEFAULT_LLM_MODEL = "gpt-5-mini"
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_USER_AGENT = "reblogging-script/1.0 (+https://dasnetzundich.de)"
 
+
+@lru_cache(maxsize=1)
 def ensure_httpx_proxy_support() -> None:
     """Abort early if httpx version lacks ``proxies`` support.
 
@@ -31,6 +53,9 @@ def ensure_httpx_proxy_support() -> None:
     which results in ``TypeError: Client.__init__() got an unexpected keyword
     argument 'proxies'``. Enforcing a compatible version up front provides a
     clearer error message than failing deep inside the OpenAI client.
+
+    The installed version cannot change mid-run, so the check is memoized and
+    the regex split only ever runs once per process.
     """
 
     version = getattr(httpx, "__version__", "0")
@@ -51,7 +76,11 @@ def parse_args() -> argparse.Namespace:
             "einer Sharkey/Misskey-Instanz."
         )
     )
-    parser.add_argument("--feed-url", help="RSS-Feed-URL", default=None)
+    parser.add_argument(
+        "--feed-url",
+        help="RSS-Feed-URL(s), mehrere durch Kommas getrennt",
+        default=None,
+    )
     parser.add_argument(
         "--days-old",
         type=int,
@@ -84,14 +113,25 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Listet nur die gefundenen Beiträge, ohne zu veröffentlichen",
     )
+    parser.add_argument(
+        "--dry-run-llm",
+        action="store_true",
+        help="Ruft auch im Dry-Run die OpenAI-API auf, um den KI-Text zu prüfen",
+    )
     return parser.parse_args()
 
 
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     url = (url or "").strip()
     if not url:
         return ""
 
+    # Schnellpfad für den Normalfall (sauberes https ohne Query/Fragment):
+    # spart den urlparse/urlunparse-Roundtrip samt Tupel-Allokationen.
+    if url.startswith("https://") and "?" not in url and "#" not in url:
+        return url.rstrip("/")
+
     parsed = urlparse(url)
     scheme = "https" if parsed.scheme == "http" else parsed.scheme
     path = parsed.path.rstrip("/")
@@ -99,10 +139,21 @@ def normalize_url(url: str) -> str:
     return urlunparse(normalized)
 
 
-def load_config(args: argparse.Namespace) -> dict:
+def parse_feed_urls(raw: str) -> List[str]:
+    return [url.strip() for url in (raw or "").split(",") if url.strip()]
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
     load_dotenv()
+
+
+def load_config(args: argparse.Namespace) -> dict:
+    load_env()
     return {
-        "feed_url": args.feed_url or os.getenv("FEED_URL", DEFAULT_FEED_URL),
+        "feed_urls": parse_feed_urls(
+            args.feed_url or os.getenv("FEED_URL", DEFAULT_FEED_URL)
+        ),
         "days_old": int(os.getenv("DAYS_OLD", args.days_old or DEFAULT_DAYS_OLD)),
         "max_posts": int(os.getenv("MAX_POSTS", args.max_posts or DEFAULT_MAX_POSTS)),
         "posted_log": args.posted_log or os.getenv("POSTED_LOG_PATH", DEFAULT_POSTED_LOG),
@@ -113,6 +164,7 @@ def load_config(args: argparse.Namespace) -> dict:
             )
         ),
         "dry_run": args.dry_run,
+        "dry_run_llm": args.dry_run_llm,
         "sharkey_instance": os.getenv("SHARKEY_INSTANCE_URL"),
         "sharkey_token": os.getenv("SHARKEY_TOKEN"),
         "sharkey_visibility": os.getenv(
@@ -120,30 +172,200 @@ def load_config(args: argparse.Namespace) -> dict:
         ),
         "openai_api_key": os.getenv("OPENAI_API_KEY"),
         "openai_model": os.getenv("OPENAI_MODEL", DEFAULT_LLM_MODEL),
+        "llm_cache": os.getenv("LLM_CACHE_PATH", DEFAULT_LLM_CACHE),
+        "feed_cache": os.getenv("FEED_CACHE_PATH", DEFAULT_FEED_CACHE),
     }
 
 
-def fetch_feed(feed_url: str) -> feedparser.FeedParserDict:
+class FeedEntry(dict):
+    """Leichter Ersatz für feedparsers FeedParserDict: Dict mit Attributzugriff."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def parse_date_string(value: str):
+    value = (value or "").strip()
+    if not value:
+        return None
     try:
-        parsed = feedparser.parse(
-            feed_url,
-            request_headers={
-                "User-Agent": "reblogging-script/1.0 (+https://dasnetzundich.de)"
-            },
-        )
-    except Exception as exc:  # pragma: no cover - defensive Netzwerkanpassung
-        raise ConnectionError(f"Feed konnte nicht geladen werden: {exc}") from exc
+        parsed = parsedate_to_datetime(value)  # RFC 822 (RSS)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))  # ISO 8601 (Atom)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).utctimetuple()
 
-    status = parsed.get("status")
-    if status and status >= 400:
-        raise ConnectionError(f"Feed antwortete mit HTTP-Status {status}")
 
-    if parsed.bozo:
-        raise ValueError(f"Feed konnte nicht gelesen werden: {parsed.bozo_exception}")
-    return parsed
+def _child_text(elem, tag: str) -> str:
+    child = elem.find(tag)
+    if child is None or child.text is None:
+        return ""
+    return child.text.strip()
 
 
-def parse_entry_date(entry) -> Optional[datetime]:
+def _entry_from_rss(elem) -> FeedEntry:
+    entry = FeedEntry(
+        title=_child_text(elem, "title"),
+        link=_child_text(elem, "link"),
+    )
+    summary = _child_text(elem, "description")
+    if summary:
+        entry["summary"] = summary
+    published = parse_date_string(_child_text(elem, "pubDate"))
+    if published:
+        entry["published_parsed"] = published
+    return entry
+
+
+def _entry_from_atom(elem) -> FeedEntry:
+    link = ""
+    for link_elem in elem.findall(_ATOM_NS + "link"):
+        if link_elem.get("rel", "alternate") == "alternate" and link_elem.get("href"):
+            link = link_elem.get("href")
+            break
+    entry = FeedEntry(title=_child_text(elem, _ATOM_NS + "title"), link=link)
+    summary = _child_text(elem, _ATOM_NS + "summary") or _child_text(
+        elem, _ATOM_NS + "content"
+    )
+    if summary:
+        entry["summary"] = summary
+    published = parse_date_string(_child_text(elem, _ATOM_NS + "published"))
+    if published:
+        entry["published_parsed"] = published
+    updated = parse_date_string(_child_text(elem, _ATOM_NS + "updated"))
+    if updated:
+        entry["updated_parsed"] = updated
+    return entry
+
+
+def parse_feed_stream(stream) -> List[FeedEntry]:
+    # Pull-Parser statt DOM: Einträge werden beim Eintreffen verarbeitet und
+    # sofort wieder freigegeben, der Speicherbedarf bleibt unabhängig von der
+    # Feed-Größe flach. RSS-<item> und Atom-<entry> laufen über denselben Pass.
+    entries: List[FeedEntry] = []
+    for _, elem in ET.iterparse(stream, events=("end",)):
+        if elem.tag == "item":
+            entries.append(_entry_from_rss(elem))
+            elem.clear()
+        elif elem.tag == _ATOM_NS + "entry":
+            entries.append(_entry_from_atom(elem))
+            elem.clear()
+    return entries
+
+
+@lru_cache(maxsize=1)
+def http_session() -> requests.Session:
+    # Eine Session für alle synchronen HTTP-Aufrufe (Feed-Abrufe): hält
+    # Verbindungen per Keep-Alive offen und fängt transiente 5xx-Fehler per
+    # exponentiellem Backoff ab, statt den ganzen Lauf scheitern zu lassen.
+    # Poolgröße passend zum ThreadPoolExecutor (4 parallele Feed-Worker).
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def load_feed_cache(path: str) -> Dict[str, dict]:
+    cache_file = pathlib.Path(path)
+    if not cache_file.exists():
+        return {}
+    try:
+        raw = orjson.loads(cache_file.read_bytes())
+    except (orjson.JSONDecodeError, OSError):  # pragma: no cover - defekter Cache
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    return {url: state for url, state in raw.items() if isinstance(state, dict)}
+
+
+def save_feed_cache(path: str, cache: Dict[str, dict]):
+    write_json_atomic(pathlib.Path(path), cache)
+
+
+def _entry_to_cache(entry: FeedEntry) -> dict:
+    data = dict(entry)
+    for attr in ("published_parsed", "updated_parsed"):
+        if data.get(attr):
+            data[attr] = list(data[attr])[:9]
+    return data
+
+
+def _entry_from_cache(data: dict) -> FeedEntry:
+    entry = FeedEntry(data)
+    for attr in ("published_parsed", "updated_parsed"):
+        if entry.get(attr):
+            entry[attr] = tuple(entry[attr])
+    return entry
+
+
+def fetch_feed(feed_url: str, cache: Optional[Dict[str, dict]] = None) -> List[FeedEntry]:
+    headers = {"User-Agent": _USER_AGENT}
+    state = (cache or {}).get(feed_url) or {}
+    # Conditional GET nur, wenn wir ein 304 auch aus dem Cache bedienen können:
+    # der Feed enthält weiterhin ungepostete Archiv-Einträge, ein 304 heißt
+    # also "nimm deine Kopie", nicht "es gibt nichts zu tun".
+    cached_entries = state.get("entries")
+    if cached_entries is not None:
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+    try:
+        response = http_session().get(feed_url, headers=headers, timeout=30, stream=True)
+    except requests.RequestException as exc:
+        raise ConnectionError(f"Feed konnte nicht geladen werden: {exc}") from exc
+
+    try:
+        if response.status_code == 304:
+            # Download und XML-Parse gespart; die Einträge des letzten Laufs
+            # gelten unverändert weiter. (cached_entries kann nur bei einem
+            # unaufgeforderten 304 des Servers leer sein.)
+            cached = cached_entries or []
+            print(
+                f"Feed unverändert (HTTP 304), verwende {len(cached)} "
+                f"zwischengespeicherte Einträge: {feed_url}"
+            )
+            return [_entry_from_cache(data) for data in cached]
+        if response.status_code >= 400:
+            raise ConnectionError(
+                f"Feed antwortete mit HTTP-Status {response.status_code}"
+            )
+        response.raw.decode_content = True
+        try:
+            entries = parse_feed_stream(response.raw)
+        except ET.ParseError as exc:
+            raise ValueError(f"Feed konnte nicht gelesen werden: {exc}") from exc
+
+        if cache is not None:
+            new_state = {}
+            if response.headers.get("ETag"):
+                new_state["etag"] = response.headers["ETag"]
+            if response.headers.get("Last-Modified"):
+                new_state["last_modified"] = response.headers["Last-Modified"]
+            if new_state:
+                new_state["entries"] = [_entry_to_cache(entry) for entry in entries]
+                cache[feed_url] = new_state
+        return entries
+    finally:
+        response.close()
+
+
+def parse_entry_timestamp(entry) -> Optional[int]:
     for attr in ("published_parsed", "updated_parsed"):
         parsed = getattr(entry, attr, None)
         if parsed:
@@ -155,30 +377,55 @@ def parse_entry_date(entry) -> Optional[datetime]:
             offset = getattr(parsed, "tm_gmtoff", None)
             if isinstance(offset, (int, float)):
                 timestamp -= offset
-
-            try:
-                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            except (OSError, OverflowError, ValueError):
-                continue
+            return int(timestamp)
     return None
 
 
-def select_old_entries(entries: Iterable, cutoff: datetime) -> List[feedparser.FeedParserDict]:
+def parse_entry_date(entry) -> Optional[datetime]:
+    timestamp = parse_entry_timestamp(entry)
+    if timestamp is None:
+        return None
+    try:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    except (OSError, OverflowError, ValueError):
+        return None
+
+
+def select_old_entries(
+    entries: Iterable, cutoff: datetime, limit: int = 0
+) -> List[Tuple[datetime, FeedEntry]]:
+    # Filter und Sortierung laufen über rohe UNIX-Timestamps; das teure
+    # tz-bewusste datetime wird nur für die wenigen Überlebenden gebaut.
+    cutoff_ts = int(cutoff.timestamp())
     selected = []
     for entry in entries:
-        published = parse_entry_date(entry)
-        if not published:
+        timestamp = parse_entry_timestamp(entry)
+        if timestamp is None or timestamp > cutoff_ts:
+            continue
+        selected.append((timestamp, entry))
+
+    if limit and limit > 0:
+        # Nur die ältesten `limit` Einträge werden gebraucht: O(n log k) statt
+        # Vollsortierung über alle historischen Feed-Einträge.
+        oldest = heapq.nsmallest(limit, selected, key=lambda item: item[0])
+    else:
+        oldest = sorted(selected, key=lambda item: item[0])
+
+    result = []
+    for timestamp, entry in oldest:
+        try:
+            result.append((datetime.fromtimestamp(timestamp, tz=timezone.utc), entry))
+        except (OSError, OverflowError, ValueError):
             continue
-        if published <= cutoff:
-            selected.append((published, entry))
-    selected.sort(key=lambda item: item[0])
-    return [entry for _, entry in selected]
+    return result
 
 
 def clean_summary(text: str) -> str:
-    text = re.sub(r"<[^>]+>", " ", text or "")
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    if HTMLParser is not None:
+        stripped = HTMLParser(text or "").text(separator=" ")
+    else:
+        stripped = _TAG_RE.sub(" ", text or "")
+    return _WS_RE.sub(" ", stripped).strip()
 
 
 def build_status(entry, published: datetime) -> str:
@@ -193,69 +440,276 @@ def build_status(entry, published: datetime) -> str:
     return "\n\n".join([part for part in parts if part])
 
 
+def load_llm_cache(path: str) -> Dict[str, str]:
+    cache_file = pathlib.Path(path)
+    if not cache_file.exists():
+        return {}
+    try:
+        raw = orjson.loads(cache_file.read_bytes())
+    except (orjson.JSONDecodeError, OSError):  # pragma: no cover - defekter Cache
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    return {key: value for key, value in raw.items() if isinstance(value, str)}
+
+
+def save_llm_cache(path: str, cache: Dict[str, str]):
+    write_json_atomic(pathlib.Path(path), dict(sorted(cache.items())))
+
+
+# Bewusst ausführlich und über alle Aufrufe identisch gehalten: OpenAI cached
+# statische Prompt-Präfixe ab 1024 Tokens automatisch und verrechnet
+# Wiederholungen günstiger. Der Block unten liegt deutlich über dieser
+# Schwelle (prüfbar über usage.prompt_tokens_details.cached_tokens in der
+# API-Antwort). Alles Eintragsspezifische gehört deshalb ausschließlich in
+# die User-Nachricht.
+_LLM_SYSTEM_PROMPT = (
+    "Du schreibst kurze, sachliche deutsche Notizen für Sharkey/Misskey. "
+    "Fasse den Inhalt jedes Blogartikels freundlich zusammen, füge einen Hinweis "
+    "auf das ursprüngliche Veröffentlichungsdatum hinzu und animiere zum Lesen. "
+    "Liefere für jeden nummerierten Eintrag genau einen Text.\n"
+    "\n"
+    "Kontext und Rolle:\n"
+    "Die Notizen erscheinen im Namen eines deutschsprachigen Technik-Blogs, der "
+    "ältere, aber weiterhin nützliche Artikel aus seinem Archiv erneut teilt. "
+    "Typische Themen sind Selfhosting, Fediverse, Linux, Datenschutz, "
+    "Heimnetzwerk und Schritt-für-Schritt-Anleitungen für Open-Source-Software. "
+    "Die Leserschaft besteht aus technisch interessierten Menschen mit sehr "
+    "unterschiedlichem Vorwissen: vom Einsteiger, der zum ersten Mal einen "
+    "eigenen Dienst aufsetzt, bis zur erfahrenen Administratorin. Schreibe so, "
+    "dass beide Gruppen sich angesprochen fühlen: konkret genug, um den Nutzen "
+    "des Artikels zu erkennen, aber ohne unnötigen Fachjargon und ohne etwas zu "
+    "erklären, was im Artikel selbst steht. Die Notiz ist eine Einladung, den "
+    "Artikel zu lesen — nicht sein Ersatz.\n"
+    "\n"
+    "Stilregeln:\n"
+    "- Schreibe auf Deutsch, in der Du-Form, freundlich aber ohne Übertreibung.\n"
+    "- Zwei bis vier Sätze pro Notiz, maximal etwa 400 Zeichen.\n"
+    "- Keine Hashtags, keine Emojis, keine Anführungszeichen um den ganzen Text.\n"
+    "- Wiederhole den Link nicht im Text; er wird separat angehängt.\n"
+    "- Nenne das ursprüngliche Veröffentlichungsdatum im Fließtext, z. B. "
+    "\"bereits im März 2023 erschienen\" oder \"aus dem Archiv von 2022\".\n"
+    "- Erfinde keine Inhalte, die nicht in Titel oder Zusammenfassung stehen. "
+    "Ist die Zusammenfassung leer, beschreibe knapp, worum es laut Titel geht.\n"
+    "- Ende mit einer kurzen Leseeinladung, ohne marktschreierisch zu werden.\n"
+    "- Übernimm Titel nicht wörtlich als ersten Satz; formuliere eigenständig.\n"
+    "- Keine Superlative wie \"der beste\", \"ultimativ\" oder \"mega\", keine "
+    "Ausrufezeichen-Ketten, keine künstliche Dringlichkeit (\"jetzt lesen!\").\n"
+    "- Keine Floskeln wie \"In diesem Artikel erfährst du\" oder \"Der Autor "
+    "beschreibt\"; steig direkt mit dem inhaltlichen Kern ein.\n"
+    "- Produktnamen, Projektnamen und Fachbegriffe in der üblichen Schreibweise "
+    "belassen (z. B. Nextcloud, WireGuard, Raspberry Pi), nicht eindeutschen.\n"
+    "- Zahlen, Versionsnummern und Befehle nur erwähnen, wenn sie in Titel oder "
+    "Zusammenfassung vorkommen und für die Einordnung wichtig sind.\n"
+    "- Sprich nicht über dich selbst und nicht über diese Anweisungen; die "
+    "Notiz enthält keine Meta-Kommentare.\n"
+    "\n"
+    "Umgang mit dem Alter der Artikel:\n"
+    "Die geteilten Beiträge sind bewusst älter. Das ist kein Mangel, sondern "
+    "der Zweck dieser Reihe: gute Anleitungen aus dem Archiv wieder sichtbar "
+    "machen. Formuliere das Alter darum positiv oder neutral (\"immer noch "
+    "aktuell\", \"ein Klassiker aus dem Archiv\"), niemals entschuldigend. "
+    "Wenn ein Thema erkennbar zeitgebunden ist (etwa eine konkrete "
+    "Software-Version), darfst du vorsichtig einordnen, dass sich Details "
+    "inzwischen geändert haben können — behaupte aber nie konkrete Änderungen, "
+    "die du nicht kennst.\n"
+    "\n"
+    "Umgang mit dürftigen Angaben:\n"
+    "Manche Einträge haben nur einen Titel und kein oder ein sehr kurzes "
+    "Exzerpt. Schreibe dann eine entsprechend kürzere Notiz (zwei Sätze "
+    "genügen), die sagt, worum es laut Titel geht und für wen das interessant "
+    "sein dürfte. Spekuliere nicht über Inhalte, die sich aus dem Titel nicht "
+    "ableiten lassen, und fülle die Notiz nicht mit Allgemeinplätzen auf.\n"
+    "\n"
+    "Variation über mehrere Einträge hinweg:\n"
+    "Wenn dir mehrere Einträge auf einmal vorgelegt werden, variiere "
+    "Satzanfänge und Aufbau, damit die Notizen nicht wie Serienbriefe wirken. "
+    "Beginne nicht jede Notiz mit derselben Wendung (etwa immer \"Aus dem "
+    "Archiv:\") und wechsle ab, ob du mit dem Nutzen, dem Thema oder dem Alter "
+    "des Artikels einsteigst. Jede Notiz muss für sich allein funktionieren, "
+    "ohne Bezug auf die anderen Einträge der Liste, denn sie werden als "
+    "separate Beiträge veröffentlicht und zu unterschiedlichen Zeiten "
+    "gelesen. Verweise deshalb nie mit Formulierungen wie \"außerdem\" oder "
+    "\"wie im vorigen Beitrag\" auf andere Notizen derselben Lieferung.\n"
+    "\n"
+    "Beispiel für eine gute Notiz:\n"
+    "\"Schon 2022 im Blog erschienen, aber immer noch aktuell: eine "
+    "Schritt-für-Schritt-Anleitung, wie du deine eigene Nextcloud absicherst. "
+    "Der Artikel erklärt die wichtigsten Einstellungen verständlich und ohne "
+    "Vorwissen. Ein Blick lohnt sich, wenn du deine Daten selbst hosten willst.\"\n"
+    "\n"
+    "Weiteres Beispiel für eine gute Notiz (dürftiges Exzerpt):\n"
+    "\"Aus dem Archiv von 2021: eine kompakte Anleitung, wie du Pi-hole in "
+    "deinem Heimnetz einrichtest. Interessant für alle, die Werbung und "
+    "Tracker zentral für alle Geräte blocken wollen.\"\n"
+    "\n"
+    "Beispiel für eine schlechte Notiz (so nicht):\n"
+    "\"🔥🔥 MEGA-Artikel!!! Unbedingt lesen: https://example.de/post #selfhosting "
+    "#nextcloud – der BESTE Guide aller Zeiten!\"\n"
+    "\n"
+    "Weiteres Beispiel für eine schlechte Notiz (so nicht — Floskeln, "
+    "Meta-Kommentar, wörtlich übernommener Titel):\n"
+    "\"In diesem Artikel mit dem Titel 'Nextcloud absichern' erfährst du laut "
+    "meiner Zusammenfassung alles Wichtige. Als KI kann ich sagen: Der Autor "
+    "beschreibt das Thema ausführlich. Leider ist der Beitrag schon etwas "
+    "älter.\""
+)
+
+# Striktes Antwortschema: eine Antwort pro Eintrag, zuordenbar über die ID.
+_LLM_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "summaries",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "text": {"type": "string"},
+                        },
+                        "required": ["id", "text"],
+                    },
+                }
+            },
+            "required": ["items"],
+        },
+    },
+}
+
+
+def build_llm_messages(items: List[Tuple[datetime, dict]]) -> List[dict]:
+    blocks = []
+    for idx, (published, entry) in enumerate(items, start=1):
+        title = entry.get("title", "Ohne Titel")
+        link = entry.get("link", "")
+        summary = clean_summary(entry.get("summary", entry.get("description", "")))
+        blocks.append(
+            f"Eintrag {idx}:\n"
+            f"Titel: {title}\n"
+            f"Link: {link}\n"
+            f"Veröffentlicht am: {published.date().isoformat()}\n"
+            f"Zusammenfassung: {summary}"
+        )
+    return [
+        {"role": "system", "content": _LLM_SYSTEM_PROMPT},
+        {"role": "user", "content": "\n\n".join(blocks)},
+    ]
+
+
+@lru_cache(maxsize=1)
+def openai_client(api_key: str) -> OpenAI:
+    # Ein Client pro Lauf: hält die TLS-Verbindung zur API offen, statt für
+    # jeden Eintrag Connection-Pool und Handshake neu aufzubauen.
+    return OpenAI(api_key=api_key)
+
+
+def llm_cache_key(*, entry, model: str) -> str:
+    title = entry.get("title", "Ohne Titel")
+    link = entry.get("link", "")
+    summary = clean_summary(entry.get("summary", entry.get("description", "")))
+    raw = f"{model}|{title}|{link}|{summary}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def generate_with_llm(
     *,
-    entry,
-    published: datetime,
+    items: List[Tuple[datetime, dict]],
     api_key: Optional[str],
     model: str,
-) -> Optional[str]:
-    if not api_key:
-        return None
+    cache: Optional[Dict[str, str]] = None,
+) -> List[Optional[str]]:
+    if not api_key or not items:
+        return [None] * len(items)
+
+    # Cache-Schlüssel vor dem teuren Client-Aufbau berechnen: Treffer kosten
+    # nur einen Dict-Lookup statt Netzwerk-Roundtrip + Modell-Latenz.
+    keys = [llm_cache_key(entry=entry, model=model) for _, entry in items]
+    texts: List[Optional[str]] = [
+        (cache.get(key) or None) if cache is not None else None for key in keys
+    ]
+    pending = [idx for idx, text in enumerate(texts) if text is None]
+    if not pending:
+        return texts
 
+    # Alle offenen Einträge in einem Aufruf bündeln: ein Netzwerk-Roundtrip
+    # statt einem pro Beitrag.
     ensure_httpx_proxy_support()
-    client = OpenAI(api_key=api_key)
-    title = entry.get("title", "Ohne Titel")
-    link = entry.get("link", "")
-    summary = clean_summary(entry.get("summary", entry.get("description", "")))
+    client = openai_client(api_key)
+    batch = [items[idx] for idx in pending]
     try:
         completion = client.chat.completions.create(
             model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Du schreibst kurze, sachliche deutsche Notizen für Sharkey/Misskey. "
-                        "Fasse den Inhalt eines Blogartikels freundlich zusammen, füge einen Hinweis "
-                        "auf das ursprüngliche Veröffentlichungsdatum hinzu und animiere zum Lesen."
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        f"Titel: {title}\n"
-                        f"Link: {link}\n"
-                        f"Veröffentlicht am: {published.date().isoformat()}\n"
-                        f"Zusammenfassung: {summary}"
-                    ),
-                },
-            ],
+            messages=build_llm_messages(batch),
+            response_format=_LLM_RESPONSE_FORMAT,
         )
     except Exception as exc:  # pragma: no cover - API-Kommunikation
         print(f"[WARNUNG] OpenAI-Antwort fehlgeschlagen ({exc}). Fallback auf Standardtext.")
-        return None
+        return texts
 
     message = completion.choices[0].message.content if completion.choices else ""
-    generated = (message or "").strip()
-    return generated or None
-
-
-def compose_status(entry, published: datetime, config: dict) -> str:
-    ai_text = generate_with_llm(
-        entry=entry,
-        published=published,
+    try:
+        payload = orjson.loads(message or "")
+    except orjson.JSONDecodeError:
+        print("[WARNUNG] OpenAI-Antwort war kein gültiges JSON. Fallback auf Standardtext.")
+        return texts
+
+    by_id = {}
+    raw_items = payload.get("items") if isinstance(payload, dict) else None
+    for item in raw_items or []:
+        if isinstance(item, dict):
+            by_id[item.get("id")] = (item.get("text") or "").strip()
+
+    for batch_id, idx in enumerate(pending, start=1):
+        generated = by_id.get(batch_id)
+        if generated:
+            texts[idx] = generated
+            if cache is not None:
+                cache[keys[idx]] = generated
+    return texts
+
+
+def compose_statuses(
+    to_post: List[Tuple[datetime, dict]],
+    config: dict,
+    llm_cache: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    # Im Dry-Run keine OpenAI-Kosten verursachen, außer der Nutzer will den
+    # KI-Text ausdrücklich sehen (--dry-run-llm).
+    if config.get("dry_run") and not config.get("dry_run_llm"):
+        return [build_status(entry, published) for published, entry in to_post]
+
+    ai_texts = generate_with_llm(
+        items=to_post,
         api_key=config.get("openai_api_key"),
         model=config.get("openai_model", DEFAULT_LLM_MODEL),
+        cache=llm_cache,
     )
-    if ai_text:
-        link = entry.get("link", "")
-        parts = [ai_text]
-        if link:
-            parts.append(f"Mehr lesen: {link}")
-        parts.append(f"(Original veröffentlicht am {published.date().isoformat()})")
-        return "\n\n".join(parts)
 
-    return build_status(entry, published)
+    statuses = []
+    for (published, entry), ai_text in zip(to_post, ai_texts):
+        if ai_text:
+            link = entry.get("link", "")
+            parts = [ai_text]
+            if link:
+                parts.append(f"Mehr lesen: {link}")
+            parts.append(f"(Original veröffentlicht am {published.date().isoformat()})")
+            statuses.append("\n\n".join(parts))
+        else:
+            statuses.append(build_status(entry, published))
+    return statuses
+
+
+def write_json_atomic(path: pathlib.Path, payload) -> None:
+    # Erst in eine Temp-Datei schreiben, dann atomar umbenennen: ein Absturz
+    # mitten im Schreiben kann das Log so nicht mehr korrumpieren.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
 
 
 def load_posted_urls(path: str) -> Dict[str, datetime]:
@@ -263,8 +717,8 @@ def load_posted_urls(path: str) -> Dict[str, datetime]:
     if not posted_file.exists():
         return {}
     try:
-        raw = json.loads(posted_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive JSON-Parsing
+        raw = orjson.loads(posted_file.read_bytes())
+    except orjson.JSONDecodeError as exc:  # pragma: no cover - defensive JSON-Parsing
         raise ValueError(
             f"Log-Datei {posted_file} enthält kein gültiges JSON: {exc}"
         ) from exc
@@ -293,14 +747,10 @@ def load_posted_urls(path: str) -> Dict[str, datetime]:
 
 
 def save_posted_urls(path: str, posted: Dict[str, datetime]):
-    posted_file = pathlib.Path(path)
-    posted_file.parent.mkdir(parents=True, exist_ok=True)
     payload = [
         {"url": url, "posted_at": ts.isoformat()} for url, ts in sorted(posted.items())
     ]
-    posted_file.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    write_json_atomic(pathlib.Path(path), payload)
 
 
 def prune_posted_log(posted: Dict[str, datetime], keep: int) -> Dict[str, datetime]:
@@ -321,8 +771,18 @@ def was_posted_ever(url: str, posted: Dict[str, datetime]) -> bool:
     return bool(normalized and normalized in posted)
 
 
-def publish_to_sharkey(
-    instance_url: str, token: str, visibility: str, text: str, dry_run: bool
+_PUBLISH_RETRY_STATUSES = (500, 502, 503, 504)
+_PUBLISH_MAX_ATTEMPTS = 5
+
+
+async def publish_to_sharkey(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    instance_url: str,
+    token: str,
+    visibility: str,
+    text: str,
+    dry_run: bool,
 ):
     if dry_run:
         print("[DRY RUN] Würde posten:\n---")
@@ -336,40 +796,91 @@ def publish_to_sharkey(
         )
 
     endpoint = f"{instance_url.rstrip('/')}/api/notes/create"
-    response = requests.post(
-        endpoint,
-        json={"i": token, "text": text, "visibility": visibility},
-        timeout=15,
-    )
-    try:
-        response.raise_for_status()
-    except requests.HTTPError as exc:  # pragma: no cover - Netzwerkanpassung
-        raise ConnectionError(
-            f"Sharkey-Antwort {response.status_code}: {response.text}"
-        ) from exc
+    last_error: Exception = ConnectionError("Sharkey nicht erreichbar.")
+    async with semaphore:
+        for attempt in range(_PUBLISH_MAX_ATTEMPTS):
+            if attempt:
+                # Exponentielles Backoff wie beim Feed-Abruf: 1s, 2s, 4s, 8s.
+                await asyncio.sleep(2 ** (attempt - 1))
+            try:
+                response = await client.post(
+                    endpoint,
+                    json={"i": token, "text": text, "visibility": visibility},
+                    timeout=15,
+                )
+            except httpx.HTTPError as exc:  # pragma: no cover - Netzwerkanpassung
+                last_error = ConnectionError(f"Sharkey nicht erreichbar: {exc}")
+                continue
 
-    print("Gepostet auf Sharkey: Status 200")
+            if response.status_code in _PUBLISH_RETRY_STATUSES:
+                last_error = ConnectionError(
+                    f"Sharkey-Antwort {response.status_code}: {response.text}"
+                )
+                continue
+            if response.status_code >= 400:
+                raise ConnectionError(
+                    f"Sharkey-Antwort {response.status_code}: {response.text}"
+                )
+
+            print(f"Gepostet auf Sharkey: Status {response.status_code}")
+            return
+    raise last_error
+
+
+async def publish_entries(statuses: List[str], config: dict) -> List[Optional[BaseException]]:
+    # Maximal vier parallele POSTs, alle über eine Verbindung bzw. einen
+    # kleinen Pool — schnell, ohne die Instanz zu fluten.
+    semaphore = asyncio.Semaphore(4)
+    async with httpx.AsyncClient(limits=httpx.Limits(max_connections=4)) as client:
+        tasks = [
+            publish_to_sharkey(
+                client,
+                semaphore,
+                config["sharkey_instance"],
+                config["sharkey_token"],
+                config["sharkey_visibility"],
+                status,
+                config["dry_run"],
+            )
+            for status in statuses
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    return [result if isinstance(result, BaseException) else None for result in results]
 
 
 def main():
     args = parse_args()
     config = load_config(args)
 
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=config["days_old"])
+    now = datetime.now(timezone.utc)
+    cutoff_date = now - timedelta(days=config["days_old"])
+    feed_urls = config["feed_urls"]
     print(
-        f"Lade Feed {config['feed_url']} und filtere Beiträge älter als {config['days_old']} Tage..."
+        f"Lade {len(feed_urls)} Feed(s) und filtere Beiträge älter als {config['days_old']} Tage..."
     )
 
-    feed = fetch_feed(config["feed_url"])
-    entries = select_old_entries(feed.entries, cutoff_date)
+    feed_cache = load_feed_cache(config["feed_cache"])
+    cache_before = {url: feed_cache.get(url) for url in feed_urls}
 
-    if not entries:
-        print("Keine passenden Beiträge gefunden.")
-        return
+    # Netzwerkabrufe parallel, Auswertung und Log-Zugriffe bleiben im Hauptthread.
+    # Jeder Worker schreibt nur den Cache-Eintrag seiner eigenen Feed-URL.
+    with ThreadPoolExecutor(max_workers=min(4, len(feed_urls))) as pool:
+        feeds = list(pool.map(lambda url: fetch_feed(url, feed_cache), feed_urls))
 
+    # Wie beim Posted-Log: ein Dry-Run hinterlässt keine Spuren auf der Platte
+    # und kann so auch keinen späteren echten Lauf in ein 304-No-Op lenken.
+    if not config["dry_run"] and any(
+        feed_cache.get(url) != cache_before[url] for url in feed_urls
+    ):
+        save_feed_cache(config["feed_cache"], feed_cache)
+
+    all_entries = [entry for feed_entries in feeds for entry in feed_entries]
+
+    # Erst bereits gepostete URLs aussortieren, damit das Limit unten nur
+    # tatsächlich postbare Einträge zählt.
     posted_log = load_posted_urls(config["posted_log"])
     candidates = []
-    for entry in entries:
+    for entry in all_entries:
         url = entry.get("link")
         if not url:
             continue
@@ -378,34 +889,39 @@ def main():
             continue
         candidates.append(entry)
 
-    if not candidates:
+    max_posts = config["max_posts"]
+    limit = max_posts if max_posts and max_posts > 0 else 1
+    to_post = select_old_entries(candidates, cutoff_date, limit=limit)
+
+    if not to_post:
         print("Keine neuen (noch nicht geposteten) Beiträge gefunden.")
         return
 
-    max_posts = config["max_posts"]
-    to_post = candidates[: max_posts] if max_posts and max_posts > 0 else candidates[:1]
+    llm_cache = load_llm_cache(config["llm_cache"])
+    llm_cache_size = len(llm_cache)
+    log_dirty = False
+    statuses = compose_statuses(to_post, config, llm_cache)
+    errors = asyncio.run(publish_entries(statuses, config))
 
-    for entry in to_post:
-        published = parse_entry_date(entry)
-        if not published:
+    for (_, entry), error in zip(to_post, errors):
+        url = entry.get("link", "")
+        if error is not None:
+            print(f"[WARNUNG] Veröffentlichen fehlgeschlagen ({url}): {error}")
             continue
-
-        status = compose_status(entry, published, config)
-        publish_to_sharkey(
-            config["sharkey_instance"],
-            config["sharkey_token"],
-            config["sharkey_visibility"],
-            status,
-            config["dry_run"],
-        )
-
-        url = entry.get("link")
         if not config["dry_run"] and url:
-            posted_log[normalize_url(url)] = datetime.now(timezone.utc)
+            # Alle Posts eines Laufs teilen sich denselben Zeitstempel.
+            posted_log[normalize_url(url)] = now
+            log_dirty = True
+
+    if len(llm_cache) != llm_cache_size:
+        save_llm_cache(config["llm_cache"], llm_cache)
 
     if not config["dry_run"]:
-        posted_log = prune_posted_log(posted_log, config["posted_log_keep"])
-        save_posted_urls(config["posted_log"], posted_log)
+        pruned_log = prune_posted_log(posted_log, config["posted_log_keep"])
+        # Nur neu schreiben, wenn sich tatsächlich etwas geändert hat; erspart
+        # Sortieren + Serialisieren großer Logs bei Läufen ohne neuen Post.
+        if log_dirty or pruned_log is not posted_log:
+            save_posted_urls(config["posted_log"], pruned_log)
 
 
 if __name__ == "__main__":